@@ -1,7 +1,6 @@
 import asyncio
 import codecs
 import contextlib
-import functools
 import io
 import re
 import sys
@@ -53,6 +52,7 @@ from .helpers import (
     netrc_from_env,
     parse_mimetype,
     reify,
+    sentinel,
     set_exception,
     set_result,
 )
@@ -96,12 +96,43 @@ if TYPE_CHECKING:
 
 
 _CONTAINS_CONTROL_CHAR_RE = re.compile(r"[^-!#$%&'*+.^_`|~0-9a-zA-Z]")
+# Well-known methods are valid tokens, so they can skip the regex check.
+_KNOWN_METHODS = frozenset(hdrs.METH_ALL | {m.lower() for m in hdrs.METH_ALL})
+# Same character set as http.cookies uses for legal keys and unquoted values.
+_COOKIE_LEGAL_CHARS_RE = re.compile(r"[\w!#$%&'*+\-.^`|~:]+", re.ASCII)
+# Escapes applied by http.cookies to values that need quoting.
+_COOKIE_UNESCAPED_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    "!#$%&'*+-.^_`|~: ()/<=>?@[]{}"
+)
+_COOKIE_ESCAPE_TABLE = {
+    n: f"\\{n:03o}" for n in range(256) if chr(n) not in _COOKIE_UNESCAPED_CHARS
+}
+_COOKIE_ESCAPE_TABLE.update({ord('"'): '\\"', ord("\\"): "\\\\"})
+_is_reserved_cookie_key = Morsel().isReservedKey
+_LINK_SPLIT_RE = re.compile(r",(?=\s*<)")
+_LINK_RE = re.compile(r"\s*<(.*)>(.*)")
+_LINK_PARAM_RE = re.compile(r"^\s*(\S*)\s*=\s*(['\"]?)(.*?)\2\s*$", re.M)
+# Read-only, so it can be shared by all responses without a Link header.
+_EMPTY_LINKS: "MultiDictProxy[MultiDictProxy[Union[str, URL]]]" = MultiDictProxy(
+    MultiDict()
+)
+# Number of frames captured for source tracebacks in debug mode,
+# matches the depth asyncio uses for tasks and handles.
+_DEBUG_STACK_DEPTH = 10
 
 
 def _gen_default_accept_encoding() -> str:
     return "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
 
 
+def _quote_cookie_value(value: str) -> str:
+    """Quote a cookie value the same way as SimpleCookie does."""
+    if _COOKIE_LEGAL_CHARS_RE.fullmatch(value):
+        return value
+    return f'"{value.translate(_COOKIE_ESCAPE_TABLE)}"'
+
+
 @frozen_dataclass_decorator
 class ContentDisposition:
     type: Optional[str]
@@ -205,15 +236,36 @@ class ClientRequest:
         hdrs.ACCEPT_ENCODING: _gen_default_accept_encoding(),
     }
 
-    # Type of body depends on PAYLOAD_REGISTRY, which is dynamic.
-    body: Any = b""
-    auth = None
-    response = None
-
-    __writer: Optional["asyncio.Task[None]"] = None  # async task for streaming data
-    _continue = None  # waiter future for '100 Continue' response
-
-    _skip_auto_headers: Optional["CIMultiDict[None]"] = None
+    __slots__ = (
+        "_session",
+        "original_url",
+        "url",
+        "method",
+        "chunked",
+        "compress",
+        "loop",
+        "length",
+        "response_class",
+        "_timer",
+        "_ssl",
+        "server_hostname",
+        "_source_traceback",
+        "version",
+        "headers",
+        "_skip_auto_headers",
+        "auth",
+        "body",
+        "proxy",
+        "proxy_auth",
+        "proxy_headers",
+        "_proxy_headers_hash",
+        "response",
+        "_continue",
+        "_traces",
+        "_request_info",
+        "_request_info_headers",
+        "__writer",
+    )
 
     # N.B.
     # Adding __del__ method with self._writer closing doesn't make sense
@@ -247,7 +299,9 @@ class ClientRequest:
         trust_env: bool = False,
         server_hostname: Optional[str] = None,
     ):
-        if match := _CONTAINS_CONTROL_CHAR_RE.search(method):
+        if method not in _KNOWN_METHODS and (
+            match := _CONTAINS_CONTROL_CHAR_RE.search(method)
+        ):
             raise ValueError(
                 f"Method cannot contain non-token characters {method!r} "
                 f"(found at least {match.group()!r})"
@@ -261,6 +315,18 @@ class ClientRequest:
         if TYPE_CHECKING:
             assert session is not None
         self._session = session
+        # Type of body depends on PAYLOAD_REGISTRY, which is dynamic.
+        self.body: Any = b""
+        self.auth: Optional[BasicAuth] = None
+        self.response: Optional[ClientResponse] = None
+        # async task for streaming data
+        self.__writer: Optional["asyncio.Task[None]"] = None
+        # waiter future for '100 Continue' response
+        self._continue: Optional["asyncio.Future[bool]"] = None
+        self._skip_auto_headers: Optional["CIMultiDict[None]"] = None
+        self._request_info: Optional[RequestInfo] = None
+        # the mapping proxied by _request_info.headers
+        self._request_info_headers: Optional[CIMultiDict[str]] = None
         if params:
             url = url.extend_query(params)
         self.original_url = url
@@ -279,9 +345,15 @@ class ClientRequest:
         self.server_hostname = server_hostname
 
         if loop.get_debug():
-            self._source_traceback = traceback.extract_stack(sys._getframe(1))
+            self._source_traceback = traceback.extract_stack(
+                sys._getframe(1), limit=_DEBUG_STACK_DEPTH
+            )
 
-        self.update_version(version)
+        if type(version) is HttpVersion:
+            # Fast path for the common case, nothing to parse.
+            self.version = version
+        else:
+            self.update_version(version)
         self.update_host(url)
         self.update_headers(headers)
         self.update_auto_headers(skip_auto_headers)
@@ -323,10 +395,6 @@ class ClientRequest:
 
     @property
     def connection_key(self) -> ConnectionKey:  # type: ignore[misc]
-        if proxy_headers := self.proxy_headers:
-            h: Optional[int] = hash(tuple(proxy_headers.items()))
-        else:
-            h = None
         url = self.url
         return tuple.__new__(
             ConnectionKey,
@@ -337,7 +405,7 @@ class ClientRequest:
                 self._ssl,
                 self.proxy,
                 self.proxy_auth,
-                h,
+                self._proxy_headers_hash,
             ),
         )
 
@@ -353,14 +421,27 @@ class ClientRequest:
 
     @property
     def request_info(self) -> RequestInfo:
-        headers: CIMultiDictProxy[str] = CIMultiDictProxy(self.headers)
-        # These are created on every request, so we use a NamedTuple
-        # for performance reasons. We don't use the RequestInfo.__new__
-        # method because it has a different signature which is provided
-        # for backwards compatibility only.
-        return tuple.__new__(
-            RequestInfo, (self.url, self.method, headers, self.original_url)
-        )
+        # The proxy is a live view of self.headers, so the same instance
+        # can be returned on every access as long as headers, url, method
+        # and original_url were not reassigned.
+        request_info = self._request_info
+        if (
+            request_info is None
+            or self._request_info_headers is not self.headers
+            or request_info.url is not self.url
+            or request_info.method is not self.method
+            or request_info.real_url is not self.original_url
+        ):
+            self._request_info_headers = self.headers
+            headers: CIMultiDictProxy[str] = CIMultiDictProxy(self.headers)
+            # These are created on every request, so we use a NamedTuple
+            # for performance reasons. We don't use the RequestInfo.__new__
+            # method because it has a different signature which is provided
+            # for backwards compatibility only.
+            request_info = self._request_info = tuple.__new__(
+                RequestInfo, (self.url, self.method, headers, self.original_url)
+            )
+        return request_info
 
     def update_host(self, url: URL) -> None:
         """Update destination host, port and connection type (ssl)."""
@@ -402,6 +483,20 @@ class ClientRequest:
         if not headers:
             return
 
+        if isinstance(headers, (CIMultiDict, CIMultiDictProxy)):
+            # ClientSession always passes a CIMultiDict, so this is the
+            # common case and the lookup is case-insensitive already.
+            overrides_host = hdrs.HOST in headers
+        elif isinstance(headers, (dict, MultiDictProxy, MultiDict)):
+            overrides_host = not hdrs.HOST_ALL.isdisjoint(headers.keys())
+        else:
+            overrides_host = True
+
+        if not overrides_host:
+            # Without a Host override, all headers can be added in one go.
+            self.headers.extend(headers)
+            return
+
         if isinstance(headers, (dict, MultiDictProxy, MultiDict)):
             headers = headers.items()
 
@@ -413,29 +508,36 @@ class ClientRequest:
                 self.headers.add(key, value)
 
     def update_auto_headers(self, skip_auto_headers: Optional[Iterable[str]]) -> None:
+        skip_headers: Optional["CIMultiDict[None]"] = None
         if skip_auto_headers is not None:
-            self._skip_auto_headers = CIMultiDict(
+            skip_headers = self._skip_auto_headers = CIMultiDict(
                 (hdr, None) for hdr in sorted(skip_auto_headers)
             )
-            used_headers = self.headers.copy()
-            used_headers.extend(self._skip_auto_headers)  # type: ignore[arg-type]
-        else:
-            # Fast path when there are no headers to skip
-            # which is the most common case.
-            used_headers = self.headers
 
+        # Test membership against the headers and the skipped headers
+        # directly instead of building a merged copy of both.
+        headers = self.headers
         for hdr, val in self.DEFAULT_HEADERS.items():
-            if hdr not in used_headers:
-                self.headers[hdr] = val
+            if hdr not in headers and (skip_headers is None or hdr not in skip_headers):
+                headers[hdr] = val
 
-        if hdrs.USER_AGENT not in used_headers:
-            self.headers[hdrs.USER_AGENT] = SERVER_SOFTWARE
+        if hdrs.USER_AGENT not in headers and (
+            skip_headers is None or hdrs.USER_AGENT not in skip_headers
+        ):
+            headers[hdrs.USER_AGENT] = SERVER_SOFTWARE
 
     def update_cookies(self, cookies: Optional[LooseCookies]) -> None:
         """Update request cookies header."""
         if not cookies:
             return
 
+        if hdrs.COOKIE not in self.headers:
+            # Fast path: serialize the name=value pairs directly instead
+            # of building a SimpleCookie, which creates a Morsel per entry.
+            if (cookie_header := self._serialize_cookies(cookies)) is not None:
+                self.headers[hdrs.COOKIE] = cookie_header
+                return
+
         c = SimpleCookie()
         if hdrs.COOKIE in self.headers:
             c.load(self.headers.get(hdrs.COOKIE, ""))
@@ -456,6 +558,35 @@ class ClientRequest:
 
         self.headers[hdrs.COOKIE] = c.output(header="", sep=";").strip()
 
+    @staticmethod
+    def _serialize_cookies(cookies: LooseCookies) -> Optional[str]:
+        """Serialize cookies into a Cookie header value.
+
+        Returns None if any cookie key is not valid, the caller should
+        then fall back to SimpleCookie which raises the appropriate error.
+        """
+        if isinstance(cookies, Mapping):
+            iter_cookies = cookies.items()
+        else:
+            iter_cookies = cookies  # type: ignore[assignment]
+        pairs: Dict[str, str] = {}
+        for name, value in iter_cookies:
+            if isinstance(value, Morsel):
+                key = value.key
+                coded_value = value.coded_value
+            else:
+                key = name
+                coded_value = _quote_cookie_value(str(value))
+            if (
+                type(key) is not str
+                or not _COOKIE_LEGAL_CHARS_RE.fullmatch(key)
+                or _is_reserved_cookie_key(key)
+            ):
+                return None
+            pairs[name] = f"{key}={coded_value}"
+        # SimpleCookie.output() sorts the cookies by name
+        return "; ".join([pairs[name] for name in sorted(pairs)])
+
     def update_content_encoding(self, data: Any, compress: Union[bool, str]) -> None:
         """Set request content encoding."""
         self.compress = None
@@ -568,6 +699,7 @@ class ClientRequest:
         if proxy is None:
             self.proxy_auth = None
             self.proxy_headers = None
+            self._proxy_headers_hash: Optional[int] = None
             return
 
         if proxy_auth and not isinstance(proxy_auth, helpers.BasicAuth):
@@ -579,6 +711,11 @@ class ClientRequest:
         ):
             proxy_headers = CIMultiDict(proxy_headers)
         self.proxy_headers = proxy_headers
+        # Computed once here as connection_key is looked up several times
+        # per request.
+        self._proxy_headers_hash = (
+            hash(tuple(proxy_headers.items())) if proxy_headers else None
+        )
 
     async def write_bytes(
         self, writer: AbstractStreamWriter, conn: "Connection"
@@ -591,14 +728,14 @@ class ClientRequest:
 
         protocol = conn.protocol
         assert protocol is not None
+        body = self.body
         try:
-            if isinstance(self.body, payload.Payload):
-                await self.body.write(writer)
+            if isinstance(body, payload.Payload):
+                await body.write(writer)
+            elif isinstance(body, (bytes, bytearray)):
+                await writer.write(body)
             else:
-                if isinstance(self.body, (bytes, bytearray)):
-                    self.body = (self.body,)
-
-                for chunk in self.body:
+                for chunk in body:
                     await writer.write(chunk)
         except OSError as underlying_exc:
             reraised_exc = underlying_exc
@@ -649,15 +786,11 @@ class ClientRequest:
             protocol,
             self.loop,
             on_chunk_sent=(
-                functools.partial(self._on_chunk_request_sent, self.method, self.url)
-                if self._traces
-                else None
-            ),
-            on_headers_sent=(
-                functools.partial(self._on_headers_request_sent, self.method, self.url)
+                self._on_chunk_request_sent  # type: ignore[arg-type]
                 if self._traces
                 else None
             ),
+            on_headers_sent=self._on_headers_request_sent if self._traces else None,
         )
 
         if self.compress:
@@ -666,6 +799,7 @@ class ClientRequest:
         if self.chunked is not None:
             writer.enable_chunking()
 
+        headers = self.headers
         # set default content-type
         if (
             self.method in self.POST_METHODS
@@ -673,21 +807,23 @@ class ClientRequest:
                 self._skip_auto_headers is None
                 or hdrs.CONTENT_TYPE not in self._skip_auto_headers
             )
-            and hdrs.CONTENT_TYPE not in self.headers
+            and hdrs.CONTENT_TYPE not in headers
         ):
-            self.headers[hdrs.CONTENT_TYPE] = "application/octet-stream"
+            headers[hdrs.CONTENT_TYPE] = "application/octet-stream"
 
+        # Only look up the Connection header when the version and the
+        # connector require one, which is not the case for the common
+        # HTTP/1.1 keep-alive request.
         v = self.version
-        if hdrs.CONNECTION not in self.headers:
-            if conn._connector.force_close:
-                if v == HttpVersion11:
-                    self.headers[hdrs.CONNECTION] = "close"
-            elif v == HttpVersion10:
-                self.headers[hdrs.CONNECTION] = "keep-alive"
+        if conn._connector.force_close:
+            if v == HttpVersion11 and hdrs.CONNECTION not in headers:
+                headers[hdrs.CONNECTION] = "close"
+        elif v == HttpVersion10 and hdrs.CONNECTION not in headers:
+            headers[hdrs.CONNECTION] = "keep-alive"
 
         # status + headers
         status_line = f"{self.method} {path} HTTP/{v.major}.{v.minor}"
-        await writer.write_headers(status_line, self.headers)
+        await writer.write_headers(status_line, headers)
         task: Optional["asyncio.Task[None]"]
         if self.body or self._continue is not None or protocol.writing_paused:
             coro = self.write_bytes(writer, conn)
@@ -744,49 +880,56 @@ class ClientRequest:
             self.__writer.remove_done_callback(self.__reset_writer)
             self.__writer = None
 
-    async def _on_chunk_request_sent(self, method: str, url: URL, chunk: bytes) -> None:
+    async def _on_chunk_request_sent(self, chunk: bytes) -> None:
         for trace in self._traces:
-            await trace.send_request_chunk_sent(method, url, chunk)
+            await trace.send_request_chunk_sent(self.method, self.url, chunk)
 
-    async def _on_headers_request_sent(
-        self, method: str, url: URL, headers: "CIMultiDict[str]"
-    ) -> None:
+    async def _on_headers_request_sent(self, headers: "CIMultiDict[str]") -> None:
         for trace in self._traces:
-            await trace.send_request_headers(method, url, headers)
+            await trace.send_request_headers(self.method, self.url, headers)
 
 
 _CONNECTION_CLOSED_EXCEPTION = ClientConnectionError("Connection closed")
 
 
+def _default_resolve_charset(response: "ClientResponse", body: bytes) -> str:
+    return "utf-8"
+
+
 class ClientResponse(HeadersMixin):
-    # Some of these attributes are None when created,
-    # but will be set by the start() method.
-    # As the end user will likely never see the None values, we cheat the types below.
-    # from the Status-Line of the response
-    version: Optional[HttpVersion] = None  # HTTP-Version
-    status: int = None  # type: ignore[assignment] # Status-Code
-    reason: Optional[str] = None  # Reason-Phrase
-
-    content: StreamReader = None  # type: ignore[assignment] # Payload stream
-    _body: Optional[bytes] = None
-    _headers: CIMultiDictProxy[str] = None  # type: ignore[assignment]
-    _history: Tuple["ClientResponse", ...] = ()
-    _raw_headers: RawHeaders = None  # type: ignore[assignment]
-
-    _connection: Optional["Connection"] = None  # current connection
-    _cookies: Optional[SimpleCookie] = None
-    _continue: Optional["asyncio.Future[bool]"] = None
-    _source_traceback: Optional[traceback.StackSummary] = None
-    _session: Optional["ClientSession"] = None
-    # set up by ClientRequest after ClientResponse object creation
-    # post-init stage allows to not change ctor signature
-    _closed = True  # to allow __del__ for non-initialized properly response
-    _released = False
-    _in_context = False
-
-    _resolve_charset: Callable[["ClientResponse", bytes], str] = lambda *_: "utf-8"
-
-    __writer: Optional["asyncio.Task[None]"] = None
+    __slots__ = (
+        "method",
+        "version",
+        "status",
+        "reason",
+        "content",
+        "_body",
+        "_headers",
+        "_history",
+        "_raw_headers",
+        "_content_type",
+        "_content_dict",
+        "_stored_content_type",
+        "_real_url",
+        "_url",
+        "_protocol",
+        "_connection",
+        "_cookies",
+        "_continue",
+        "_source_traceback",
+        "_session",
+        "_request_info",
+        "_timer",
+        "_cache",
+        "_traces",
+        "_loop",
+        "_closed",
+        "_released",
+        "_in_context",
+        "_encoding",
+        "_resolve_charset",
+        "__writer",
+    )
 
     def __init__(
         self,
@@ -801,11 +944,42 @@ class ClientResponse(HeadersMixin):
         loop: asyncio.AbstractEventLoop,
         session: "ClientSession",
     ) -> None:
+        # Set first to allow __del__ for non-initialized properly response
+        self._closed = True
+        self._connection: Optional["Connection"] = None  # current connection
+
         # URL forbids subclasses, so a simple type check is enough.
         assert type(url) is URL
 
         self.method = method
 
+        # Some of these attributes are None when created,
+        # but will be set by the start() method.
+        # As the end user will likely never see the None values,
+        # we cheat the types below.
+        # from the Status-Line of the response
+        self.version: Optional[HttpVersion] = None  # HTTP-Version
+        self.status: int = None  # type: ignore[assignment] # Status-Code
+        self.reason: Optional[str] = None  # Reason-Phrase
+
+        self.content: StreamReader = None  # type: ignore[assignment] # Payload stream
+        self._body: Optional[bytes] = None
+        self._headers: CIMultiDictProxy[str] = None  # type: ignore[assignment]
+        self._history: Tuple["ClientResponse", ...] = ()
+        self._raw_headers: RawHeaders = None  # type: ignore[assignment]
+        # HeadersMixin state
+        self._content_type: Optional[str] = None
+        self._content_dict: Optional[Dict[str, str]] = None
+        self._stored_content_type: Union[str, None, _SENTINEL] = sentinel
+
+        self._cookies: Optional[SimpleCookie] = None
+        self._continue: Optional["asyncio.Future[bool]"] = None
+        self._source_traceback: Optional[traceback.StackSummary] = None
+        self._released = False
+        self._in_context = False
+        self._encoding: Optional[str] = None  # cached get_encoding() result
+        self.__writer: Optional["asyncio.Task[None]"] = None
+
         self._real_url = url
         self._url = url.with_fragment(None) if url.raw_fragment else url
         if writer is not None:
@@ -820,12 +994,18 @@ class ClientResponse(HeadersMixin):
         # Save reference to _resolve_charset, so that get_encoding() will still
         # work after the response has finished reading the body.
         # TODO: Fix session=None in tests (see ClientRequest.__init__).
+        self._session: Optional["ClientSession"] = None
+        self._resolve_charset: Callable[["ClientResponse", bytes], str] = (
+            _default_resolve_charset
+        )
         if session is not None:
             # store a reference to session #1985
             self._session = session
             self._resolve_charset = session._resolve_charset
         if loop.get_debug():
-            self._source_traceback = traceback.extract_stack(sys._getframe(1))
+            self._source_traceback = traceback.extract_stack(
+                sys._getframe(1), limit=_DEBUG_STACK_DEPTH
+            )
 
     def __reset_writer(self, _: object = None) -> None:
         self.__writer = None
@@ -944,15 +1124,15 @@ class ClientResponse(HeadersMixin):
 
     @reify
     def links(self) -> "MultiDictProxy[MultiDictProxy[Union[str, URL]]]":
-        links_str = ", ".join(self.headers.getall("link", []))
+        links_str = ", ".join(self.headers.getall(hdrs.LINK, ()))
 
         if not links_str:
-            return MultiDictProxy(MultiDict())
+            return _EMPTY_LINKS
 
         links: MultiDict[MultiDictProxy[Union[str, URL]]] = MultiDict()
 
-        for val in re.split(r",(?=\s*<)", links_str):
-            match = re.match(r"\s*<(.*)>(.*)", val)
+        for val in _LINK_SPLIT_RE.split(links_str):
+            match = _LINK_RE.match(val)
             if match is None:  # Malformed link
                 continue
             url, params_str = match.groups()
@@ -961,16 +1141,20 @@ class ClientResponse(HeadersMixin):
             link: MultiDict[Union[str, URL]] = MultiDict()
 
             for param in params:
-                match = re.match(r"^\s*(\S*)\s*=\s*(['\"]?)(.*?)(\2)\s*$", param, re.M)
+                match = _LINK_PARAM_RE.match(param)
                 if match is None:  # Malformed param
                     continue
-                key, _, value, _ = match.groups()
+                key, _, value = match.groups()
 
                 link.add(key, value)
 
             key = link.get("rel", url)
 
-            link.add("url", self.url.join(URL(url)))
+            link_url = URL(url)
+            if not (link_url.scheme and link_url.absolute):
+                # Resolve relative references against the response URL.
+                link_url = self.url.join(link_url)
+            link.add("url", link_url)
 
             links.add(str(key), MultiDictProxy(link))
 
@@ -1013,14 +1197,14 @@ class ClientResponse(HeadersMixin):
         self.reason = message.reason
 
         # headers
-        self._headers = message.headers  # type is CIMultiDictProxy
+        self._headers = headers = message.headers  # type is CIMultiDictProxy
         self._raw_headers = message.raw_headers  # type is Tuple[bytes, bytes]
 
         # payload
         self.content = payload
 
         # cookies
-        if cookie_hdrs := self.headers.getall(hdrs.SET_COOKIE, ()):
+        if cookie_hdrs := headers.getall(hdrs.SET_COOKIE, ()):
             cookies = SimpleCookie()
             for hdr in cookie_hdrs:
                 try:
@@ -1079,30 +1263,32 @@ class ClientResponse(HeadersMixin):
         return 400 > self.status
 
     def raise_for_status(self) -> None:
-        if not self.ok:
-            # reason should always be not None for a started response
-            assert self.reason is not None
-
-            # If we're in a context we can rely on __aexit__() to release as the
-            # exception propagates.
-            if not self._in_context:
-                self.release()
-
-            raise ClientResponseError(
-                self.request_info,
-                self.history,
-                status=self.status,
-                message=self.reason,
-                headers=self.headers,
-            )
+        if self.ok:
+            return
 
-    def _release_connection(self) -> None:
+        # reason should always be not None for a started response
+        assert self.reason is not None
+
+        # If we're in a context we can rely on __aexit__() to release as the
+        # exception propagates.
+        if not self._in_context:
+            self.release()
+
+        raise ClientResponseError(
+            self.request_info,
+            self.history,
+            status=self.status,
+            message=self.reason,
+            headers=self.headers,
+        )
+
+    def _release_connection(self, _: object = None) -> None:
         if self._connection is not None:
             if self.__writer is None:
                 self._connection.release()
                 self._connection = None
             else:
-                self.__writer.add_done_callback(lambda f: self._release_connection())
+                self.__writer.add_done_callback(self._release_connection)
 
     async def _wait_released(self) -> None:
         if self.__writer is not None:
@@ -1157,19 +1343,30 @@ class ClientResponse(HeadersMixin):
         elif self._released:  # Response explicitly released
             raise ClientConnectionError("Connection closed")
 
-        protocol = self._connection and self._connection.protocol
+        connection = self._connection
+        if connection is None and self.__writer is None:
+            # Nothing left to wait for, e.g. on repeated read() calls.
+            return self._body
+        protocol = connection and connection.protocol
         if protocol is None or not protocol.upgraded:
             await self._wait_released()  # Underlying connection released
         return self._body
 
     def get_encoding(self) -> str:
+        if self._encoding is None:
+            self._encoding = self._get_encoding()
+        return self._encoding
+
+    def _get_encoding(self) -> str:
         ctype = self.headers.get(hdrs.CONTENT_TYPE, "").lower()
         mimetype = helpers.parse_mimetype(ctype)
 
         encoding = mimetype.parameters.get("charset")
         if encoding:
-            with contextlib.suppress(LookupError, ValueError):
+            try:
                 return codecs.lookup(encoding).name
+            except (LookupError, ValueError):
+                pass
 
         if mimetype.type == "application" and (
             mimetype.subtype == "json" or mimetype.subtype == "rdap"
@@ -1192,6 +1389,9 @@ class ClientResponse(HeadersMixin):
         if encoding is None:
             encoding = self.get_encoding()
 
+        if errors == "strict":
+            # Skip keyword argument parsing for the default error handler.
+            return self._body.decode(encoding)  # type: ignore[union-attr]
         return self._body.decode(encoding, errors=errors)  # type: ignore[union-attr]
 
     async def json(
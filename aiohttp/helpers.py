@@ -735,22 +735,27 @@ def ceil_timeout(
 class HeadersMixin:
     """Mixin for handling headers."""
 
+    __slots__ = ()
+
     _headers: MultiMapping[str]
     _content_type: Optional[str] = None
     _content_dict: Optional[Dict[str, str]] = None
     _stored_content_type: Union[str, None, _SENTINEL] = sentinel
 
     def _parse_content_type(self, raw: Optional[str]) -> None:
-        self._stored_content_type = raw
         if raw is None:
             # default value according to RFC 2616
-            self._content_type = "application/octet-stream"
-            self._content_dict = {}
+            content_type = "application/octet-stream"
+            content_dict: Dict[str, str] = {}
         else:
             content_type, content_mapping_proxy = parse_content_type(raw)
-            self._content_type = content_type
             # _content_dict needs to be mutable so we can update it
-            self._content_dict = content_mapping_proxy.copy()
+            content_dict = content_mapping_proxy.copy()
+        # Slotted subclasses declare these attributes in their own __slots__,
+        # the others store them in their __dict__.
+        self._stored_content_type = raw  # type: ignore[misc]
+        self._content_type = content_type  # type: ignore[misc]
+        self._content_dict = content_dict  # type: ignore[misc]
 
     @property
     def content_type(self) -> str:
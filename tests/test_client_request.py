@@ -4,7 +4,7 @@ import io
 import pathlib
 import sys
 import zlib
-from http.cookies import BaseCookie, Morsel, SimpleCookie
+from http.cookies import BaseCookie, CookieError, Morsel, SimpleCookie
 from typing import (
     Any,
     AsyncIterator,
@@ -33,7 +33,7 @@ from aiohttp.client_reqrep import (
     _gen_default_accept_encoding,
 )
 from aiohttp.connector import Connection
-from aiohttp.http import HttpVersion10, HttpVersion11
+from aiohttp.http import SERVER_SOFTWARE, HttpVersion10, HttpVersion11
 from aiohttp.test_utils import make_mocked_coro
 from aiohttp.typedefs import LooseCookies
 
@@ -123,11 +123,21 @@ def test_method_invalid(make_request: _RequestMaker) -> None:
         make_request("METHOD WITH\nWHITESPACES", "http://python.org/")
 
 
+def test_method_custom_token(make_request: _RequestMaker) -> None:
+    req = make_request("propfind", "http://python.org/")
+    assert req.method == "PROPFIND"
+
+
 def test_version_1_0(make_request: _RequestMaker) -> None:
     req = make_request("get", "http://python.org/", version="1.0")
     assert req.version == (1, 0)
 
 
+def test_version_http_version(make_request: _RequestMaker) -> None:
+    req = make_request("get", "http://python.org/", version=HttpVersion10)
+    assert req.version is HttpVersion10
+
+
 def test_version_default(make_request: _RequestMaker) -> None:
     req = make_request("get", "http://python.org/")
     assert req.version == (1, 1)
@@ -140,6 +150,39 @@ def test_request_info(make_request: _RequestMaker) -> None:
     assert req.request_info == aiohttp.RequestInfo(url, "GET", h, url)
 
 
+def test_request_info_is_cached(make_request: _RequestMaker) -> None:
+    req = make_request("get", "http://python.org/")
+    request_info = req.request_info
+    assert req.request_info is request_info
+    req.headers["X-Added"] = "later"
+    assert request_info.headers["X-Added"] == "later"
+
+
+def test_request_info_after_url_and_method_change(
+    make_request: _RequestMaker,
+) -> None:
+    req = make_request("get", "http://proxy.example.com/")
+    assert req.request_info.method == "GET"
+
+    req.method = hdrs.METH_CONNECT
+    req.url = URL("https://python.org/")
+    request_info = req.request_info
+    assert request_info.method == "CONNECT"
+    assert request_info.url == URL("https://python.org/")
+    assert request_info.real_url == URL("http://proxy.example.com/")
+    assert req.request_info is request_info
+
+
+def test_request_info_after_update_headers(make_request: _RequestMaker) -> None:
+    req = make_request("get", "http://python.org/")
+    assert "X-New" not in req.request_info.headers
+
+    req.update_headers({"X-New": "value"})
+    request_info = req.request_info
+    assert request_info.headers["X-New"] == "value"
+    assert req.request_info is request_info
+
+
 def test_request_info_with_fragment(make_request: _RequestMaker) -> None:
     req = make_request("get", "http://python.org/#urlfragment")
     h = CIMultiDictProxy(req.headers)
@@ -348,6 +391,24 @@ def test_skip_default_useragent_header(make_request: _RequestMaker) -> None:
     assert "User-Agent" not in req.headers
 
 
+def test_skip_default_headers_keeps_explicit_headers(
+    make_request: _RequestMaker,
+) -> None:
+    req = make_request(
+        "get",
+        "http://python.org/",
+        headers={"Accept-Encoding": "identity"},
+        skip_auto_headers={"accept", "accept-encoding"},
+    )
+
+    assert "Accept" not in req.headers
+    assert req.headers.getall("Accept-Encoding") == ["identity"]
+    assert req.headers["User-Agent"] == SERVER_SOFTWARE
+    assert req.skip_auto_headers == CIMultiDict(
+        {"accept": None, "accept-encoding": None}
+    )
+
+
 def test_headers(make_request: _RequestMaker) -> None:
     req = make_request(
         "post", "http://python.org/", headers={"Content-Type": "text/plain"}
@@ -366,6 +427,21 @@ def test_headers_list(make_request: _RequestMaker) -> None:
     assert req.headers["CONTENT-TYPE"] == "text/plain"
 
 
+def test_headers_cimultidict(make_request: _RequestMaker) -> None:
+    headers = CIMultiDict([("X-Multi", "1"), ("x-multi", "2")])
+    req = make_request("get", "http://python.org/", headers=headers)
+    assert req.headers["HOST"] == "python.org"
+    assert req.headers.getall("X-MULTI") == ["1", "2"]
+
+
+def test_headers_cimultidict_explicit_host(make_request: _RequestMaker) -> None:
+    headers = CIMultiDict([("X-Custom", "1"), ("HOST", "example.com")])
+    req = make_request("get", "http://python.org/", headers=headers)
+    assert req.headers.getall("Host") == ["example.com"]
+    assert list(req.headers)[0] == "HOST"
+    assert req.headers["X-Custom"] == "1"
+
+
 def test_headers_default(make_request: _RequestMaker) -> None:
     req = make_request(
         "get", "http://python.org/", headers={"ACCEPT-ENCODING": "deflate"}
@@ -497,6 +573,13 @@ def test_path_not_contain_fragment2(make_request: _RequestMaker) -> None:
     assert str(req.url) == "http://example.com/path?key=value"
 
 
+def test_url_without_fragment_is_reused(loop: asyncio.AbstractEventLoop) -> None:
+    url = URL("http://example.com/path?key=value")
+    req = ClientRequest("GET", url, loop=loop)
+    assert req.url is url
+    assert req.original_url is url
+
+
 def test_cookies(make_request: _RequestMaker) -> None:
     req = make_request("get", "http://test.com/path", cookies={"cookie1": "val1"})
 
@@ -511,6 +594,15 @@ def test_cookies_is_quoted_with_special_characters(make_request: _RequestMaker)
     assert 'cookie1="val/one"' == req.headers["COOKIE"]
 
 
+def test_cookies_escaped_like_simple_cookie(make_request: _RequestMaker) -> None:
+    value = 'a "quoted" \\ value\x01\xe9'
+    req = make_request("get", "http://test.com/path", cookies={"cookie1": value})
+
+    expected = SimpleCookie({"cookie1": value}).output(header="").strip()
+    assert expected == req.headers["COOKIE"]
+    assert 'cookie1="a \\"quoted\\" \\\\ value\\001\\351"' == req.headers["COOKIE"]
+
+
 def test_cookies_merge_with_headers(make_request: _RequestMaker) -> None:
     req = make_request(
         "get",
@@ -522,6 +614,23 @@ def test_cookies_merge_with_headers(make_request: _RequestMaker) -> None:
     assert "cookie1=val1; cookie2=val2" == req.headers["COOKIE"]
 
 
+def test_cookies_sorted_and_last_value_wins(make_request: _RequestMaker) -> None:
+    req = make_request(
+        "get",
+        "http://test.com/path",
+        cookies=[("cookie2", "val2"), ("cookie1", "val1"), ("cookie2", "val3")],
+    )
+
+    assert "cookie1=val1; cookie2=val3" == req.headers["COOKIE"]
+
+
+def test_cookies_invalid_key(make_request: _RequestMaker) -> None:
+    with pytest.raises(CookieError):
+        make_request("get", "http://test.com/path", cookies={"bad key": "val"})
+    with pytest.raises(CookieError):
+        make_request("get", "http://test.com/path", cookies={"path": "val"})
+
+
 def test_query_multivalued_param(make_request: _RequestMaker) -> None:
     for meth in ClientRequest.ALL_METHODS:
         req = make_request(
@@ -923,7 +1032,7 @@ async def test_chunked_empty_body(
         loop=loop,
         data=b"",
     )
-    with mock.patch.object(req, "write_bytes") as write_bytes:
+    with mock.patch.object(ClientRequest, "write_bytes") as write_bytes:
         resp = await req.send(conn)
     assert "chunked" == req.headers["TRANSFER-ENCODING"]
     assert write_bytes.called
@@ -1048,12 +1157,14 @@ async def test_data_stream(
     assert req.headers["TRANSFER-ENCODING"] == "chunked"
     original_write_bytes = req.write_bytes
 
-    async def _mock_write_bytes(writer: AbstractStreamWriter, conn: mock.Mock) -> None:
+    async def _mock_write_bytes(
+        _: ClientRequest, writer: AbstractStreamWriter, conn: mock.Mock
+    ) -> None:
         # Ensure the task is scheduled
         await asyncio.sleep(0)
         await original_write_bytes(writer, conn)
 
-    with mock.patch.object(req, "write_bytes", _mock_write_bytes):
+    with mock.patch.object(ClientRequest, "write_bytes", _mock_write_bytes):
         resp = await req.send(conn)
     assert asyncio.isfuture(req._writer)
     await resp.wait_for_close()
@@ -1163,7 +1274,7 @@ async def test_data_stream_continue(
     async def coro() -> None:
         await asyncio.sleep(0.0001)
         assert req._continue is not None
-        req._continue.set_result(1)
+        req._continue.set_result(True)
 
     t = loop.create_task(coro())
 
@@ -1188,7 +1299,7 @@ async def test_data_continue(
     async def coro() -> None:
         await asyncio.sleep(0.0001)
         assert req._continue is not None
-        req._continue.set_result(1)
+        req._continue.set_result(True)
 
     t = loop.create_task(coro())
 
@@ -1284,7 +1395,7 @@ async def test_terminate(loop: asyncio.AbstractEventLoop, conn: mock.Mock) -> No
         # Ensure the task is scheduled
         await asyncio.sleep(0)
 
-    with mock.patch.object(req, "write_bytes", _mock_write_bytes):
+    with mock.patch.object(ClientRequest, "write_bytes", _mock_write_bytes):
         resp = await req.send(conn)
 
     assert req._writer is not None
@@ -1317,7 +1428,7 @@ def test_terminate_with_closed_loop(
             # Ensure the task is scheduled
             await asyncio.sleep(0)
 
-        with mock.patch.object(req, "write_bytes", _mock_write_bytes):
+        with mock.patch.object(ClientRequest, "write_bytes", _mock_write_bytes):
             resp = await req.send(conn)
 
         assert req._writer is not None
@@ -7,7 +7,7 @@ from json import JSONDecodeError
 from unittest import mock
 
 import pytest
-from multidict import CIMultiDict, CIMultiDictProxy
+from multidict import CIMultiDict, CIMultiDictProxy, MultiDictProxy
 from pytest_mock import MockerFixture
 from yarl import URL
 
@@ -85,6 +85,46 @@ def test_del(session: ClientSession) -> None:
     connection.release.assert_called_with()
 
 
+def test_source_traceback_in_debug_mode(session: ClientSession) -> None:
+    loop = mock.Mock()
+    loop.get_debug.return_value = True
+    response = ClientResponse(
+        "get",
+        URL("http://def-cl-resp.org"),
+        request_info=mock.Mock(),
+        writer=None,
+        continue100=None,
+        timer=TimerNoop(),
+        traces=[],
+        loop=loop,
+        session=session,
+    )
+
+    assert response._source_traceback is not None
+    assert 0 < len(response._source_traceback) <= 10
+    assert (
+        response._source_traceback[-1].name == "test_source_traceback_in_debug_mode"
+    )
+
+
+def test_no_instance_dict(session: ClientSession) -> None:
+    response = ClientResponse(
+        "get",
+        URL("http://def-cl-resp.org"),
+        request_info=mock.Mock(),
+        writer=None,
+        continue100=None,
+        timer=TimerNoop(),
+        traces=[],
+        loop=mock.Mock(),
+        session=session,
+    )
+
+    assert not hasattr(response, "__dict__")
+    with pytest.raises(AttributeError):
+        response.foo = 1  # type: ignore[attr-defined]
+
+
 def test_close(loop: asyncio.AbstractEventLoop, session: ClientSession) -> None:
     response = ClientResponse(
         "get",
@@ -219,6 +259,54 @@ async def test_read_and_release_connection(
     assert response._connection is None
 
 
+async def test_read_twice_skips_wait_released(
+    loop: asyncio.AbstractEventLoop, session: ClientSession
+) -> None:
+    response = ClientResponse(
+        "get",
+        URL("http://def-cl-resp.org"),
+        request_info=mock.Mock(),
+        writer=None,
+        continue100=None,
+        timer=TimerNoop(),
+        traces=[],
+        loop=loop,
+        session=session,
+    )
+    response._body = b"payload"
+
+    with mock.patch.object(ClientResponse, "_wait_released") as m:
+        assert await response.read() == b"payload"
+        assert await response.read() == b"payload"
+    assert not m.called
+
+
+async def test_release_connection_after_writer_done(
+    loop: asyncio.AbstractEventLoop, session: ClientSession
+) -> None:
+    writer = loop.create_future()
+    response = ClientResponse(
+        "get",
+        URL("http://def-cl-resp.org"),
+        request_info=mock.Mock(),
+        writer=writer,  # type: ignore[arg-type]
+        continue100=None,
+        timer=TimerNoop(),
+        traces=[],
+        loop=loop,
+        session=session,
+    )
+    connection = response._connection = mock.Mock()
+
+    response._release_connection()
+    assert not connection.release.called
+
+    writer.set_result(None)
+    await asyncio.sleep(0)
+    connection.release.assert_called_once_with()
+    assert response.connection is None
+
+
 async def test_read_and_release_connection_with_error(
     loop: asyncio.AbstractEventLoop, session: ClientSession
 ) -> None:
@@ -479,7 +567,7 @@ async def test_text_custom_encoding(
     response._headers = CIMultiDictProxy(CIMultiDict(h))
     content = response.content = mock.Mock()
     content.read.side_effect = side_effect
-    with mock.patch.object(response, "get_encoding") as m:
+    with mock.patch.object(ClientResponse, "get_encoding") as m:
         res = await response.text(encoding="cp1251")
         assert res == '{"тест": "пройден"}'
         assert response._connection is None
@@ -763,7 +851,7 @@ async def test_json_override_encoding(
     response._headers = CIMultiDictProxy(CIMultiDict(h))
     content = response.content = mock.Mock()
     content.read.side_effect = side_effect
-    with mock.patch.object(response, "get_encoding") as m:
+    with mock.patch.object(ClientResponse, "get_encoding") as m:
         res = await response.json(encoding="cp1251")
         assert res == {"тест": "пройден"}
         assert response._connection is None
@@ -790,6 +878,30 @@ def test_get_encoding_unknown(
     assert response.get_encoding() == "utf-8"
 
 
+def test_get_encoding_cached(
+    loop: asyncio.AbstractEventLoop, session: ClientSession
+) -> None:
+    response = ClientResponse(
+        "get",
+        URL("http://def-cl-resp.org"),
+        request_info=mock.Mock(),
+        writer=WriterMock(),
+        continue100=None,
+        timer=TimerNoop(),
+        traces=[],
+        loop=loop,
+        session=session,
+    )
+
+    h = {"Content-Type": "text/html; charset=cp1251"}
+    response._headers = CIMultiDictProxy(CIMultiDict(h))
+    with mock.patch("aiohttp.client_reqrep.codecs.lookup") as m:
+        m.return_value.name = "cp1251"
+        assert response.get_encoding() == "cp1251"
+        assert response.get_encoding() == "cp1251"
+    m.assert_called_once_with("cp1251")
+
+
 def test_raise_for_status_2xx() -> None:
     response = ClientResponse(
         "get",
@@ -1217,6 +1329,25 @@ def test_response_real_url(
     assert response.real_url == url
 
 
+def test_response_url_without_fragment_is_reused(
+    loop: asyncio.AbstractEventLoop, session: ClientSession
+) -> None:
+    url = URL("http://def-cl-resp.org/")
+    response = ClientResponse(
+        "get",
+        url,
+        request_info=mock.Mock(),
+        writer=WriterMock(),
+        continue100=None,
+        timer=TimerNoop(),
+        traces=[],
+        loop=loop,
+        session=session,
+    )
+    assert response.url is url
+    assert response.real_url is url
+
+
 def test_response_links_comma_separated(
     loop: asyncio.AbstractEventLoop, session: ClientSession
 ) -> None:
@@ -1340,6 +1471,28 @@ def test_response_links_relative(
     }
 
 
+def test_response_links_scheme_relative(
+    loop: asyncio.AbstractEventLoop, session: ClientSession
+) -> None:
+    url = URL("https://def-cl-resp.org/")
+    response = ClientResponse(
+        "get",
+        url,
+        request_info=mock.Mock(),
+        writer=WriterMock(),
+        continue100=None,
+        timer=TimerNoop(),
+        traces=[],
+        loop=loop,
+        session=session,
+    )
+    h = (("Link", "<//example.com/page/2>; rel=next"),)
+    response._headers = CIMultiDictProxy(CIMultiDict(h))
+    assert response.links == {
+        "next": {"url": URL("https://example.com/page/2"), "rel": "next"}
+    }
+
+
 def test_response_links_empty(
     loop: asyncio.AbstractEventLoop, session: ClientSession
 ) -> None:
@@ -1357,6 +1510,7 @@ def test_response_links_empty(
     )
     response._headers = CIMultiDictProxy(CIMultiDict())
     assert response.links == {}
+    assert isinstance(response.links, MultiDictProxy)
 
 
 def test_response_not_closed_after_get_ok(mocker: MockerFixture) -> None:
@@ -1374,7 +1528,7 @@ def test_response_not_closed_after_get_ok(mocker: MockerFixture) -> None:
     response.status = 400
     response.reason = "Bad Request"
     response._closed = False
-    spy = mocker.spy(response, "raise_for_status")
+    spy = mocker.spy(ClientResponse, "raise_for_status")
     assert not response.ok
     assert not response.closed
     assert spy.call_count == 0
@@ -278,9 +278,9 @@ class TestProxy(unittest.TestCase):
             session=mock.Mock(),
         )
         with mock.patch.object(
-            proxy_req, "send", autospec=True, return_value=proxy_resp
+            ClientRequest, "send", autospec=True, return_value=proxy_resp
         ):
-            with mock.patch.object(proxy_resp, "start", autospec=True) as m:
+            with mock.patch.object(ClientResponse, "start", autospec=True) as m:
                 m.return_value.status = 200
 
                 async def make_conn() -> aiohttp.TCPConnector:
@@ -361,9 +361,9 @@ class TestProxy(unittest.TestCase):
             session=mock.Mock(),
         )
         with mock.patch.object(
-            proxy_req, "send", autospec=True, return_value=proxy_resp
+            ClientRequest, "send", autospec=True, return_value=proxy_resp
         ):
-            with mock.patch.object(proxy_resp, "start", autospec=True) as m:
+            with mock.patch.object(ClientResponse, "start", autospec=True) as m:
                 m.return_value.status = 200
 
                 async def make_conn() -> aiohttp.TCPConnector:
@@ -458,14 +458,14 @@ class TestProxy(unittest.TestCase):
                 )
                 with (
                     mock.patch.object(
-                        proxy_req,
+                        ClientRequest,
                         "send",
                         autospec=True,
                         spec_set=True,
                         return_value=proxy_resp,
                     ),
                     mock.patch.object(
-                        proxy_resp,
+                        ClientResponse,
                         "start",
                         autospec=True,
                         spec_set=True,
@@ -552,9 +552,9 @@ class TestProxy(unittest.TestCase):
             session=mock.Mock(),
         )
         with mock.patch.object(
-            proxy_req, "send", autospec=True, return_value=proxy_resp
+            ClientRequest, "send", autospec=True, return_value=proxy_resp
         ):
-            with mock.patch.object(proxy_resp, "start", autospec=True) as m:
+            with mock.patch.object(ClientResponse, "start", autospec=True) as m:
                 m.return_value.status = 200
 
                 async def make_conn() -> aiohttp.TCPConnector:
@@ -634,9 +634,9 @@ class TestProxy(unittest.TestCase):
             session=mock.Mock(),
         )
         with mock.patch.object(
-            proxy_req, "send", autospec=True, return_value=proxy_resp
+            ClientRequest, "send", autospec=True, return_value=proxy_resp
         ):
-            with mock.patch.object(proxy_resp, "start", autospec=True) as m:
+            with mock.patch.object(ClientResponse, "start", autospec=True) as m:
                 m.return_value.status = 200
 
                 async def make_conn() -> aiohttp.TCPConnector:
@@ -711,9 +711,9 @@ class TestProxy(unittest.TestCase):
             session=mock.Mock(),
         )
         with mock.patch.object(
-            proxy_req, "send", autospec=True, return_value=proxy_resp
+            ClientRequest, "send", autospec=True, return_value=proxy_resp
         ):
-            with mock.patch.object(proxy_resp, "start", autospec=True) as m:
+            with mock.patch.object(ClientResponse, "start", autospec=True) as m:
                 m.return_value.status = 200
 
                 async def make_conn() -> aiohttp.TCPConnector:
@@ -786,9 +786,9 @@ class TestProxy(unittest.TestCase):
             session=mock.Mock(),
         )
         with mock.patch.object(
-            proxy_req, "send", autospec=True, return_value=proxy_resp
+            ClientRequest, "send", autospec=True, return_value=proxy_resp
         ):
-            with mock.patch.object(proxy_resp, "start", autospec=True) as m:
+            with mock.patch.object(ClientResponse, "start", autospec=True) as m:
                 m.return_value.status = 400
                 m.return_value.reason = "bad request"
 
@@ -862,10 +862,13 @@ class TestProxy(unittest.TestCase):
             session=mock.Mock(),
         )
         with mock.patch.object(
-            proxy_req, "send", autospec=True, return_value=proxy_resp
+            ClientRequest, "send", autospec=True, return_value=proxy_resp
         ):
             with mock.patch.object(
-                proxy_resp, "start", autospec=True, side_effect=OSError("error message")
+                ClientResponse,
+                "start",
+                autospec=True,
+                side_effect=OSError("error message"),
             ):
 
                 async def make_conn() -> aiohttp.TCPConnector:
@@ -998,9 +1001,9 @@ class TestProxy(unittest.TestCase):
             session=mock.Mock(),
         )
         with mock.patch.object(
-            proxy_req, "send", autospec=True, return_value=proxy_resp
+            ClientRequest, "send", autospec=True, return_value=proxy_resp
         ):
-            with mock.patch.object(proxy_resp, "start", autospec=True) as m:
+            with mock.patch.object(ClientResponse, "start", autospec=True) as m:
                 m.return_value.status = 200
 
                 async def make_conn() -> aiohttp.TCPConnector:
@@ -1091,9 +1094,9 @@ class TestProxy(unittest.TestCase):
             session=mock.Mock(),
         )
         with mock.patch.object(
-            proxy_req, "send", autospec=True, return_value=proxy_resp
+            ClientRequest, "send", autospec=True, return_value=proxy_resp
         ):
-            with mock.patch.object(proxy_resp, "start", autospec=True) as m:
+            with mock.patch.object(ClientResponse, "start", autospec=True) as m:
                 m.return_value.status = 200
 
                 async def make_conn() -> aiohttp.TCPConnector: